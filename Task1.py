@@ -1,4 +1,14 @@
 import streamlit as st
+from submission_sink import SubmissionSink, open_store
+
+SUBMISSIONS_FILE = "submissions.jsonl"  # use a .db path for SQLite
+
+
+# One sink shared by every session, flushed in batches
+@st.cache_resource
+def get_sink():
+    return SubmissionSink(open_store(SUBMISSIONS_FILE), max_batch=100, max_delay=1.0)
+
 
 st.title("Simple User Form")
 
@@ -10,6 +20,14 @@ with st.form("user_form"):
     # Submit button
     submitted = st.form_submit_button("Submit")
 
+sink = get_sink()
+
 # When the submit button is pressed
 if submitted:
+    sink.submit(name, age)
     st.success(f"Hello, {name}! You are {age} years old 🎉")
+
+st.caption(f"{sink.count()} submissions so far")
+if sink.count():
+    with st.expander("Submissions by age"):
+        st.bar_chart({"submissions": sink.age_histogram()})
@@ -1,56 +1,258 @@
+import argparse
+import csv
 import time
-import pyautogui
-import pyperclip
 
-# Safety options
-pyautogui.FAILSAFE = True
-pyautogui.PAUSE = 0.25
+DEFAULT_CONTACT = "sonali"
+DEFAULT_MESSAGE = "An automatic love note straight from Ms. Azaghis heart"
 
-def main():
-    contact_name = "sonali"
-    message_text = "An automatic love note straight from Ms. Azaghis heart"
+# Polling / timeout settings (seconds)
+POLL_INTERVAL = 0.1
+LAUNCH_TIMEOUT = 15
+STEP_TIMEOUT = 5
+SETTLE_TIME = 0.4  # screen must stay unchanged this long to count as "loaded"
+RESULTS_SETTLE = 1.0  # search results region must stay unchanged this long
+RESULTS_MIN_WAIT = 5.0  # fixed floor for search results when no --results-region is given
+
+
+# ---------------- Backends ---------------- #
+
+class PyAutoGuiBackend:
+    """Real keyboard/screen via pyautogui + pyperclip (Windows, or Linux under X / Xvfb)."""
+
+    def __init__(self, pause=0.05):
+        import pyautogui
+        import pyperclip
+
+        # Safety options
+        pyautogui.FAILSAFE = True
+        pyautogui.PAUSE = pause
+        self.gui = pyautogui
+        self.clip = pyperclip
+
+    def press(self, key):
+        self.gui.press(key)
+
+    def hotkey(self, *keys):
+        self.gui.hotkey(*keys)
+
+    def typewrite(self, text):
+        self.gui.typewrite(text, interval=0.02)
+
+    def paste(self, text):
+        self.clip.copy(text)
+        self.gui.hotkey('ctrl', 'v')
+
+    def frame(self, region=None):
+        return self.gui.screenshot(region=region).tobytes()
+
+
+class MockBackend:
+    """
+    Fake screen for dry runs: every input changes the "screen" after `lag` seconds.
+    Records all inputs in `self.log`.
+    """
+
+    def __init__(self, lag=0.05):
+        self.lag = lag
+        self.log = []
+        self._changes = []
+
+    def _input(self, *event):
+        self.log.append(event)
+        self._changes.append(time.monotonic() + self.lag)
+
+    def press(self, key):
+        self._input('press', key)
+
+    def hotkey(self, *keys):
+        self._input('hotkey', *keys)
+
+    def typewrite(self, text):
+        self._input('type', text)
+
+    def paste(self, text):
+        self._input('paste', text)
+
+    def frame(self, region=None):
+        now = time.monotonic()
+        return sum(1 for t in self._changes if t <= now)
+
+
+# ---------------- Waiting helpers ---------------- #
 
+def wait_for_change(backend, before, region=None, timeout=STEP_TIMEOUT):
+    """Polls until the screen region differs from `before`. Returns False on timeout."""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if backend.frame(region) != before:
+            return True
+        time.sleep(POLL_INTERVAL)
+    return False
 
-    print("Starting in 3 seconds... Move mouse to top-left corner to cancel.")
-    time.sleep(3)
+
+def wait_for_stable(backend, region=None, settle=SETTLE_TIME, timeout=STEP_TIMEOUT):
+    """Polls until the screen region stops changing for `settle` seconds. Returns False on timeout."""
+    deadline = time.monotonic() + timeout
+    last = backend.frame(region)
+    stable_since = time.monotonic()
+    while time.monotonic() < deadline:
+        time.sleep(POLL_INTERVAL)
+        current = backend.frame(region)
+        if current != last:
+            last = current
+            stable_since = time.monotonic()
+        elif time.monotonic() - stable_since >= settle:
+            return True
+    return False
+
+
+def run_step(backend, timings, name, action, region=None, timeout=STEP_TIMEOUT, settle=0.0, min_wait=0.0):
+    """
+    Runs one input action, waits for the screen region to react (then to stay
+    unchanged for `settle` seconds, and at least `min_wait` seconds in total)
+    and records how long it took.
+    """
+    before = backend.frame(region)
+    t0 = time.perf_counter()
+    action()
+    changed = wait_for_change(backend, before, region, timeout)
+    if changed and settle:
+        # Not fatal if it never settles (e.g. a blinking cursor in the region)
+        wait_for_stable(backend, region, settle=settle, timeout=timeout)
+    remaining = min_wait - (time.perf_counter() - t0)
+    if changed and remaining > 0:
+        time.sleep(remaining)
+    timings.append((name, time.perf_counter() - t0))
+    if not changed:
+        raise TimeoutError(f"'{name}': screen did not change within {timeout}s")
+
+
+# ---------------- Automation ---------------- #
+
+def open_whatsapp(backend, region=None):
+    timings = []
 
     # 1️⃣ Press Windows key to open search
-    pyautogui.press('win')
-    time.sleep(0.8)
+    run_step(backend, timings, "start menu", lambda: backend.press('win'), region)
 
-    # 2️⃣ Type "whatsapp" and open it
-    pyautogui.typewrite('whatsapp', interval=0.05)
-    time.sleep(0.3)
-    pyautogui.press('enter')
-    time.sleep(3)  # wait for WhatsApp to load
+    # 2️⃣ Type "whatsapp" and open it, wait until it has finished drawing
+    run_step(backend, timings, "type query", lambda: backend.typewrite('whatsapp'), region)
+    run_step(backend, timings, "launch", lambda: backend.press('enter'), region,
+             timeout=LAUNCH_TIMEOUT, settle=SETTLE_TIME)
+    return timings
 
+
+def send_message(backend, contact_name, message_text, timings, region=None, results_region=None):
+    """Sends one message, appending (step, seconds) to `timings` as each step completes."""
     # 3️⃣ Open WhatsApp search (Ctrl + F)
-    pyautogui.hotkey('ctrl', 'f')
-    time.sleep(0.3)
+    run_step(backend, timings, "search", lambda: backend.hotkey('ctrl', 'f'), region)
+
+    # 4️⃣ Type the contact name and wait for search results to settle.
+    # The paste itself changes the screen, so watching the whole screen can report
+    # "settled" before slow results render and the next Down/Enter would open the
+    # wrong chat. Watch only the results list when --results-region is given;
+    # otherwise keep the old fixed 5 s as a floor.
+    if results_region:
+        run_step(backend, timings, "contact", lambda: backend.paste(contact_name), results_region,
+                 settle=RESULTS_SETTLE)
+    else:
+        run_step(backend, timings, "contact", lambda: backend.paste(contact_name), region,
+                 settle=RESULTS_SETTLE, min_wait=RESULTS_MIN_WAIT)
+
+    # 5️⃣ Move down to the first result
+    run_step(backend, timings, "select", lambda: backend.press('down'), region)
+
+    # 6️⃣ Open the chat
+    run_step(backend, timings, "open chat", lambda: backend.press('enter'), region, settle=SETTLE_TIME)
+
+    # 7️⃣ Type and send the message
+    run_step(backend, timings, "type message", lambda: backend.paste(message_text), region)
+    run_step(backend, timings, "send", lambda: backend.press('enter'), region)
 
-    # 4️⃣ Type the contact name ("karthiapk")
-    pyperclip.copy(contact_name)
-    pyautogui.hotkey('ctrl', 'v')
-    time.sleep(0.2)
 
-    # 5️⃣ Wait 5 seconds for search results
-    time.sleep(5)
+def send_batch(backend, recipients, region=None, results_region=None):
+    """
+    Opens WhatsApp once and sends each (contact, message) pair.
+    Returns a list of (contact, timings, error) per recipient; error is None on success.
+    """
+    results = []
+    for i, (contact, message) in enumerate(recipients, 1):
+        timings = []  # kept on failure: shows which step timed out and how long the others took
+        t0 = time.perf_counter()
+        try:
+            send_message(backend, contact, message, timings, region, results_region)
+            error = None
+        except TimeoutError as e:
+            error = str(e)
+            backend.press('esc')  # back out of a half-open search before the next contact
+        total = time.perf_counter() - t0
+        results.append((contact, timings, error))
+
+        steps = ", ".join(f"{name} {secs:.2f}" for name, secs in timings)
+        if error:
+            print(f"[{i}/{len(recipients)}] {contact}: FAILED after {total:.2f} s ({steps}) — {error}")
+        else:
+            print(f"[{i}/{len(recipients)}] {contact}: sent in {total:.2f} s ({steps})")
+    return results
+
+
+def print_summary(launch_timings, results, elapsed):
+    sent = [r for r in results if r[2] is None]
+    launch = sum(secs for _, secs in launch_timings)
+    print(f"\nApp launch: {launch:.2f} s")
+    print(f"✅ {len(sent)}/{len(results)} sent in {elapsed:.2f} s"
+          + (f" — avg {sum(s for r in sent for _, s in r[1]) / len(sent):.2f} s per recipient" if sent else ""))
+
+    per_step = {}
+    for _, timings, _ in sent:
+        for name, secs in timings:
+            per_step.setdefault(name, []).append(secs)
+    if per_step:
+        print("Average per step: " + ", ".join(
+            f"{name} {sum(v) / len(v):.2f} s (max {max(v):.2f})" for name, v in per_step.items()))
+
+
+def load_recipients(path, default_message):
+    """Reads a CSV with a `name` column and an optional `message` column."""
+    with open(path, newline="", encoding="utf-8") as f:
+        return [(row["name"].strip(), (row.get("message") or default_message).strip())
+                for row in csv.DictReader(f) if row.get("name", "").strip()]
+
+
+def parse_region(text):
+    return tuple(int(v) for v in text.split(",")) if text else None
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Send WhatsApp messages via keyboard automation.")
+    parser.add_argument("--recipients", help="CSV file with name[,message] columns (batch mode)")
+    parser.add_argument("--contact", default=DEFAULT_CONTACT)
+    parser.add_argument("--message", default=DEFAULT_MESSAGE)
+    parser.add_argument("--region", type=parse_region, help="left,top,width,height of the screen area to watch")
+    parser.add_argument("--results-region", type=parse_region,
+                        help="left,top,width,height of the contact search results list "
+                             "(without it each contact search waits at least 5 s)")
+    parser.add_argument("--pause", type=float, default=0.05, help="pyautogui.PAUSE between actions (s)")
+    parser.add_argument("--dry-run", action="store_true", help="use a mock screen/keyboard instead of pyautogui")
+    args = parser.parse_args()
 
-    # 6️⃣ Move down once and wait 2 seconds
-    pyautogui.press('down')
-    time.sleep(2)
+    if args.recipients:
+        recipients = load_recipients(args.recipients, args.message)
+    else:
+        recipients = [(args.contact, args.message)]
 
-    # 7️⃣ Open the chat
-    pyautogui.press('enter')
-    time.sleep(1)
+    if args.dry_run:
+        backend = MockBackend()
+    else:
+        backend = PyAutoGuiBackend(pause=args.pause)
+        print("Starting in 3 seconds... Move mouse to top-left corner to cancel.")
+        time.sleep(3)
 
-    # 8️⃣ Type and send the message
-    pyperclip.copy(message_text)
-    pyautogui.hotkey('ctrl', 'v')
-    time.sleep(0.2)
-    pyautogui.press('enter')
+    t0 = time.perf_counter()
+    launch_timings = open_whatsapp(backend, args.region)
+    results = send_batch(backend, recipients, args.region, args.results_region)
+    print_summary(launch_timings, results, time.perf_counter() - t0)
 
-    print("✅ Message sent successfully!")
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,251 @@
+# load_test.py
+"""
+Headless concurrent-session load test for the water tracker (Task6.py) and
+the gym logger (Task7.py).
+
+N simulated sessions run at the same moment, on threads or processes, and
+each one submits a series of entries either through the apps' helper
+functions (driver "func") or through Streamlit's AppTest (driver "apptest").
+The report shows p50/p95/p99 action latency, throughput, error counts and
+an integrity check comparing what was submitted with what was stored.
+
+Examples:
+    python load_test.py water --sessions 20 --actions 25
+    python load_test.py gym --sessions 8 --mode process --driver apptest
+
+All data is written to a fresh temporary directory unless --workdir is given.
+AppTest is not built for concurrent use inside one interpreter (threaded runs
+occasionally drop a submission), so --driver apptest requires --mode process.
+Exit code is 1 when the stored data does not match the successful submissions.
+"""
+import argparse
+import importlib
+import multiprocessing
+import os
+import random
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from datetime import date
+
+APP_DIR = os.path.dirname(os.path.abspath(__file__))
+APP_FILES = {"water": "Task6.py", "gym": "Task7.py"}
+WATER_AMOUNTS = [100, 250, 500]  # ml
+
+
+# ---------- App access ----------------------------------------
+
+def load_app(target):
+    if APP_DIR not in sys.path:
+        sys.path.insert(0, APP_DIR)
+    return importlib.import_module(APP_FILES[target][:-3])
+
+
+def init_store(target):
+    app = load_app(target)
+    if target == "water":
+        app.init_file()
+    else:
+        app.init_db()
+
+
+def stored_total(target):
+    """Total ml logged (water) or number of rows (gym) currently in the store."""
+    app = load_app(target)
+    if target == "water":
+        return int(app.read_logs()["water_ml"].sum())
+    return len(app.fetch_df())
+
+
+# ---------- Drivers -------------------------------------------
+# Each action returns what it submitted: ml for water, one row for gym.
+
+class AppError(Exception):
+    """An exception raised by the app script under AppTest, keeping its original type name."""
+
+    def __init__(self, type_name, message):
+        super().__init__(message)
+        self.type_name = type_name
+
+
+def error_key(e):
+    """Groups errors by type and the first line of the message, e.g. 'OperationalError: database is locked'."""
+    name = getattr(e, "type_name", type(e).__name__)
+    lines = str(e).strip().splitlines()
+    return f"{name}: {lines[0][:120]}" if lines else name
+
+
+def func_action(target, session_id, i, rng):
+    app = load_app(target)
+    if target == "water":
+        amount = rng.choice(WATER_AMOUNTS)
+        app.add_water(amount)
+        return amount
+    app.add_workout(date.today().isoformat(), f"load-{session_id}", 3, 8, 60.0, f"action {i}")
+    return 1
+
+
+def widget(elements, label):
+    for w in elements:
+        if w.label == label:
+            return w
+    raise LookupError(f"No widget labelled {label!r}")
+
+
+def make_apptest(target, timeout):
+    from streamlit.testing.v1 import AppTest
+
+    at = AppTest.from_file(os.path.join(APP_DIR, APP_FILES[target]), default_timeout=timeout)
+    at.run()
+    return at
+
+
+def apptest_action(at, target, session_id, i, rng):
+    if target == "water":
+        amount = rng.choice(WATER_AMOUNTS)
+        widget(at.number_input, "Add water (ml)").set_value(amount)
+        submitted = amount
+    else:
+        widget(at.text_input, "Exercise").set_value(f"load-{session_id}")
+        widget(at.text_area, "Notes").set_value(f"action {i}")
+        submitted = 1
+    widget(at.button, "Add").click()
+    at.run()
+    if at.exception:
+        exc = at.exception[0]
+        raise AppError(exc.proto.type or "Exception", exc.message)
+    return submitted
+
+
+def run_session(target, driver, session_id, actions, barrier, think, seed, timeout):
+    """
+    Runs one simulated session. Returns (first_action_start, last_action_end, results)
+    with wall-clock times and one (latency_seconds, error_key_or_None, submitted_value)
+    per action.
+    """
+    rng = random.Random(seed + session_id)
+    try:
+        at = make_apptest(target, timeout) if driver == "apptest" else None
+    except Exception:
+        barrier.abort()  # don't leave the other sessions waiting for this one
+        raise
+
+    # All sessions start together, after every one has finished its setup
+    barrier.wait()
+
+    started = time.time()
+    results = []
+    for i in range(actions):
+        t0 = time.perf_counter()
+        try:
+            if at is None:
+                value = func_action(target, session_id, i, rng)
+            else:
+                value = apptest_action(at, target, session_id, i, rng)
+            results.append((time.perf_counter() - t0, None, value))
+        except Exception as e:
+            results.append((time.perf_counter() - t0, error_key(e), 0))
+        if think:
+            time.sleep(think)
+    return started, time.time(), results
+
+
+# ---------- Report --------------------------------------------
+
+def percentiles(values, points=(50, 95, 99)):
+    if not values:
+        return {p: 0.0 for p in points}
+    if len(values) == 1:
+        return {p: values[0] for p in points}
+    cuts = statistics.quantiles(values, n=100, method="inclusive")
+    return {p: cuts[p - 1] for p in points}
+
+
+def print_report(args, workdir, results, session_errors, elapsed, submitted, stored):
+    latencies = [r[0] * 1000 for r in results]
+    errors = Counter(r[1] for r in results if r[1] is not None)
+    ok = len(results) - sum(errors.values())
+    pct = percentiles(latencies)
+    unit = "ml" if args.target == "water" else "rows"
+
+    print(f"Target: {args.target}  driver: {args.driver}  mode: {args.mode}  "
+          f"sessions: {args.sessions} x {args.actions} actions")
+    print(f"Workdir: {workdir}")
+    print(f"Actions: {ok} ok, {len(results) - ok} failed in {elapsed:.2f} s "
+          f"({ok / elapsed if elapsed > 0 else 0:.1f} actions/s)")
+    print(f"Latency (ms): p50 {pct[50]:.1f}  p95 {pct[95]:.1f}  p99 {pct[99]:.1f}  "
+          f"max {max(latencies, default=0):.1f}")
+    if errors or session_errors:
+        print("Errors:")
+        for name, count in (errors + session_errors).most_common():
+            print(f"  {name}: {count}")
+    status = "OK" if stored == submitted else f"MISMATCH ({submitted - stored:+d} {unit} missing)"
+    print(f"Integrity: submitted {submitted} {unit}, stored {stored} {unit} -> {status}")
+
+
+# ---------- Main ----------------------------------------------
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Concurrent-session load test for Task6/Task7.")
+    parser.add_argument("target", choices=sorted(APP_FILES), help="water = Task6.py, gym = Task7.py")
+    parser.add_argument("--sessions", type=int, default=10, help="concurrent simulated sessions")
+    parser.add_argument("--actions", type=int, default=20, help="submissions per session")
+    parser.add_argument("--mode", choices=["thread", "process"], default="thread")
+    parser.add_argument("--driver", choices=["func", "apptest"], default="func")
+    parser.add_argument("--think", type=float, default=0.0, help="pause between actions (s)")
+    parser.add_argument("--timeout", type=float, default=30.0, help="AppTest run timeout (s)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--workdir", help="directory for the CSV/DB (default: new temp dir)")
+    args = parser.parse_args(argv)
+    if args.driver == "apptest" and args.mode == "thread":
+        parser.error("--driver apptest is unreliable with threads; use --mode process")
+
+    # The apps use relative storage paths; worker threads and processes share this cwd
+    workdir = os.path.abspath(args.workdir or tempfile.mkdtemp(prefix=f"loadtest-{args.target}-"))
+    os.makedirs(workdir, exist_ok=True)
+    os.chdir(workdir)
+
+    init_store(args.target)
+    baseline = stored_total(args.target)
+
+    results = []
+    session_errors = Counter()
+    spans = []
+    if args.mode == "thread":
+        manager = None
+        barrier = threading.Barrier(args.sessions)
+        pool = ThreadPoolExecutor(max_workers=args.sessions)
+    else:
+        manager = multiprocessing.Manager()
+        barrier = manager.Barrier(args.sessions)
+        pool = ProcessPoolExecutor(max_workers=args.sessions)
+    with pool:
+        futures = [
+            pool.submit(run_session, args.target, args.driver, s, args.actions,
+                        barrier, args.think, args.seed, args.timeout)
+            for s in range(args.sessions)
+        ]
+        for fut in futures:
+            try:
+                started, finished, session_results = fut.result()
+                spans.append((started, finished))
+                results.extend(session_results)
+            except Exception as e:
+                session_errors[f"session setup {error_key(e)}"] += 1
+    if manager is not None:
+        manager.shutdown()
+    # Throughput window: first action of any session to the last one to finish
+    elapsed = max(f for _, f in spans) - min(s for s, _ in spans) if spans else 0.0
+
+    submitted = sum(r[2] for r in results if r[1] is None)
+    stored = stored_total(args.target) - baseline
+    print_report(args, workdir, results, session_errors, elapsed, submitted, stored)
+    return 0 if stored == submitted else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
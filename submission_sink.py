@@ -0,0 +1,196 @@
+# submission_sink.py
+"""
+Buffered, thread-safe storage for form submissions (used by Task1.py).
+
+Submissions are kept in memory and appended to the store in batches by a
+background thread, either when `max_batch` records are waiting or every
+`max_delay` seconds; submit() itself never touches the store. Anything still
+buffered is flushed on close() / interpreter exit. Failed flushes are
+retried, so records are written at least once.
+
+Counts and the age histogram come from an in-memory aggregate that is seeded
+from the store once and then updated on every submit.
+"""
+import atexit
+import json
+import os
+import sqlite3
+import threading
+from collections import Counter
+from datetime import datetime, timezone
+
+
+# ---------- Stores ----------------------------------------------
+
+class JsonlStore:
+    def __init__(self, path):
+        self.path = path
+        self._check_tail = True
+
+    def _ends_with_newline(self):
+        try:
+            with open(self.path, "rb") as f:
+                f.seek(-1, os.SEEK_END)
+                return f.read(1) == b"\n"
+        except OSError:
+            return True  # missing or empty file
+
+    def append_many(self, records):
+        lines = "".join(json.dumps(r, ensure_ascii=False) + "\n" for r in records)
+        # Terminate a torn last line first, otherwise our first record would be
+        # glued onto it and skipped by load()
+        if self._check_tail and not self._ends_with_newline():
+            lines = "\n" + lines
+        self._check_tail = True
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write(lines)
+            f.flush()
+            os.fsync(f.fileno())
+        self._check_tail = False
+
+    def load(self):
+        if not os.path.exists(self.path):
+            return
+        with open(self.path, encoding="utf-8") as f:
+            for line in f:
+                try:
+                    yield json.loads(line)
+                except json.JSONDecodeError:
+                    continue  # torn last line from a crash mid-write
+
+
+class SqliteStore:
+    def __init__(self, path):
+        self.path = path
+        conn = self._conn()
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS submissions ("
+            "id INTEGER PRIMARY KEY AUTOINCREMENT,"
+            "name TEXT NOT NULL,"
+            "age INTEGER NOT NULL,"
+            "submitted_at TEXT NOT NULL"
+            ")"
+        )
+        conn.commit()
+        conn.close()
+
+    def _conn(self):
+        return sqlite3.connect(self.path, timeout=30)
+
+    def append_many(self, records):
+        conn = self._conn()
+        with conn:
+            conn.executemany(
+                "INSERT INTO submissions (name, age, submitted_at) VALUES (?, ?, ?)",
+                [(r["name"], r["age"], r["submitted_at"]) for r in records],
+            )
+        conn.close()
+
+    def load(self):
+        conn = self._conn()
+        rows = conn.execute("SELECT name, age, submitted_at FROM submissions").fetchall()
+        conn.close()
+        for name, age, submitted_at in rows:
+            yield {"name": name, "age": age, "submitted_at": submitted_at}
+
+
+def open_store(path):
+    """Picks the store from the file extension: .db/.sqlite -> SQLite, anything else -> JSONL."""
+    if os.path.splitext(path)[1].lower() in (".db", ".sqlite", ".sqlite3"):
+        return SqliteStore(path)
+    return JsonlStore(path)
+
+
+# ---------- Sink ------------------------------------------------
+
+class SubmissionSink:
+    def __init__(self, store, max_batch=100, max_delay=1.0):
+        self.store = store
+        self.max_batch = max_batch
+        self.max_delay = max_delay
+
+        self._lock = threading.Lock()        # buffer + aggregate
+        self._flush_lock = threading.Lock()  # one writer at a time
+        self._buffer = []
+        self._total = 0
+        self._ages = Counter()
+        for record in store.load():
+            self._count(record)
+
+        self._closed = threading.Event()
+        self._wake = threading.Event()
+        self._thread = threading.Thread(target=self._flush_loop, name="submission-sink", daemon=True)
+        self._thread.start()
+        atexit.register(self.close)
+
+    def _count(self, record):
+        self._total += 1
+        self._ages[int(record["age"])] += 1
+
+    def submit(self, name, age):
+        record = {
+            "name": name,
+            "age": int(age),
+            "submitted_at": datetime.now(timezone.utc).isoformat(),
+        }
+        with self._lock:
+            self._buffer.append(record)
+            self._count(record)
+            full = len(self._buffer) >= self.max_batch
+        if full:
+            self._wake.set()  # flush on the background thread; a store error must not reach the caller
+        return record
+
+    def flush(self):
+        with self._flush_lock:
+            with self._lock:
+                batch, self._buffer = self._buffer, []
+            if not batch:
+                return 0
+            try:
+                self.store.append_many(batch)
+            except Exception:
+                # Put the batch back in front so the next flush retries it
+                with self._lock:
+                    self._buffer[:0] = batch
+                raise
+            return len(batch)
+
+    def _flush_loop(self):
+        while not self._closed.is_set():
+            self._wake.wait(self.max_delay)
+            self._wake.clear()
+            try:
+                self.flush()
+            except Exception:
+                pass  # records stay buffered; retried on the next tick
+
+    def close(self):
+        if self._closed.is_set():
+            return
+        self._closed.set()
+        self._wake.set()
+        self._thread.join()
+        self.flush()
+        atexit.unregister(self.close)
+
+    # ---------- Queries (served from the aggregate) ----------
+
+    def count(self):
+        with self._lock:
+            return self._total
+
+    def pending(self):
+        with self._lock:
+            return len(self._buffer)
+
+    def age_histogram(self, bucket_size=10):
+        """Returns {"1-10": n, "11-20": n, ...} for buckets that have submissions."""
+        with self._lock:
+            ages = dict(self._ages)
+        buckets = Counter()
+        for age, n in ages.items():
+            start = (age - 1) // bucket_size * bucket_size + 1
+            buckets[start] += n
+        return {f"{s}-{s + bucket_size - 1}": buckets[s] for s in sorted(buckets)}